@@ -1,7 +1,13 @@
+import copy
+from unittest import mock
+
+from django.db import connection
 from django.test import TestCase as DjangoTestCase
 
-from valedictory.exceptions import NoData, ValidationException
+from valedictory.exceptions import (
+    InvalidDataException, NoData, ValidationException)
 from valedictory.ext.django import ForeignKeyField, URLField
+from valedictory.fields import ListField
 
 from ...utils import ValidatorTestCase
 from .models import TestModel
@@ -52,6 +58,14 @@ class TestForeignKeyField(ValidatorTestCase, DjangoTestCase):
         error = cm.exception
         self.assertEqual(error.msg, str(field.error_messages['missing']))
 
+    def test_error_message_is_string(self):
+        field = ForeignKeyField(TestModel.objects.all())
+        with self.assertRaises(ValidationException) as cm:
+            field.clean(1000)
+        error = cm.exception
+        self.assertIs(type(error.msg), str)
+        self.assertEqual(str(error), "Object does not exist")
+
     def test_invalid_type(self):
         field = ForeignKeyField(TestModel.objects.all())
         foo = TestModel.objects.create(name="foo")
@@ -80,3 +94,100 @@ class TestForeignKeyField(ValidatorTestCase, DjangoTestCase):
             field.clean("foo")
         error = cm.exception
         self.assertEqual(error.msg, field.error_messages['multiple'])
+
+    def test_deepcopy(self):
+        field = ForeignKeyField(TestModel.objects.filter(name="foo"))
+        foo = TestModel.objects.create(name="foo")
+        bar = TestModel.objects.create(name="bar")
+
+        copied = copy.deepcopy(field)
+        self.assertIsNot(field.queryset, copied.queryset)
+        self.assertEqual(foo, copied.clean(foo.pk))
+        with self.assertRaises(ValidationException):
+            copied.clean(bar.pk)
+
+
+class TestForeignKeyListField(ValidatorTestCase, DjangoTestCase):
+
+    def test_valid_fks(self):
+        field = ListField(ForeignKeyField(TestModel.objects.all()))
+        foo = TestModel.objects.create(name="foo")
+        bar = TestModel.objects.create(name="bar")
+        with self.assertNumQueries(1):
+            self.assertEqual([bar, foo, bar], field.clean([bar.pk, foo.pk, bar.pk]))
+
+    def test_empty_list(self):
+        field = ListField(ForeignKeyField(TestModel.objects.all()))
+        with self.assertNumQueries(0):
+            self.assertEqual([], field.clean([]))
+
+    def test_invalid_fks(self):
+        field = ListField(ForeignKeyField(TestModel.objects.all()))
+        foo = TestModel.objects.create(name="foo")
+        # Missing keys are checked again individually
+        with self.assertNumQueries(2):
+            with self.assertRaises(InvalidDataException) as cm:
+                field.clean([foo.pk, 1000, str(foo.pk)])
+
+        self.assertEqual(cm.exception, InvalidDataException({
+            1: [ValidationException("Object does not exist", 'missing')],
+            2: [ValidationException("Expected a value of type 'foreign key'", 'invalid_type')],
+        }))
+
+    def test_to_field(self):
+        field = ListField(ForeignKeyField(
+            TestModel.objects.all(), field="name", key_type=str))
+        foo = TestModel.objects.create(name="foo")
+        TestModel.objects.create(name="bar")
+        TestModel.objects.create(name="bar")
+
+        self.assertEqual([foo], field.clean(["foo"]))
+
+        with self.assertRaises(InvalidDataException) as cm:
+            field.clean(["foo", "bar", "baz"])
+        self.assertEqual(cm.exception, InvalidDataException({
+            1: [ValidationException("Multiple objects returned", 'multiple')],
+            2: [ValidationException("Object does not exist", 'missing')],
+        }))
+
+    def test_batches(self):
+        field = ListField(ForeignKeyField(TestModel.objects.all()))
+        foo = TestModel.objects.create(name="foo")
+        bar = TestModel.objects.create(name="bar")
+        baz = TestModel.objects.create(name="baz")
+        with mock.patch.object(connection.features, 'max_query_params', 2):
+            with self.assertNumQueries(2):
+                self.assertEqual([foo, bar, baz], field.clean([foo.pk, bar.pk, baz.pk]))
+
+    def test_values_queryset(self):
+        field = ListField(ForeignKeyField(TestModel.objects.values('id', 'name')))
+        foo = TestModel.objects.create(name="foo")
+        self.assertEqual([{'id': foo.pk, 'name': "foo"}], field.clean([foo.pk]))
+
+    def test_unconvertible_key(self):
+        # Keys that can not be converted fail in the same way as in ``clean``
+        field = ForeignKeyField(TestModel.objects.all(), key_type=str)
+        foo = TestModel.objects.create(name="foo")
+        self.assertEqual([foo], ListField(field).clean([str(foo.pk)]))
+        with self.assertRaises(ValueError):
+            field.clean("abc")
+        with self.assertRaises(ValueError):
+            ListField(field).clean([str(foo.pk), "abc"])
+
+    def test_no_query_param_limit(self):
+        # Some backends, such as PostgreSQL, have no limit on query parameters
+        field = ListField(ForeignKeyField(TestModel.objects.all()))
+        foo = TestModel.objects.create(name="foo")
+        with mock.patch.object(connection.features, 'max_query_params', None):
+            self.assertEqual([], field.clean([]))
+            self.assertEqual([foo], field.clean([foo.pk]))
+            with self.assertRaises(InvalidDataException) as cm:
+                field.clean(["x"])
+        self.assertEqual(cm.exception, InvalidDataException({
+            0: [ValidationException("Expected a value of type 'foreign key'", 'invalid_type')],
+        }))
+
+    def test_manager(self):
+        field = ListField(ForeignKeyField(TestModel.objects))
+        foo = TestModel.objects.create(name="foo")
+        self.assertEqual([foo], field.clean([foo.pk]))
@@ -102,3 +102,78 @@ class TestFlatten(ValidatorTestCase):
             (('bar', 1), 'bar 1 error'),
             (('bar', 3), 'bar 3 error'),
             (('foo',), 'foo error')]))
+
+    def test_order(self):
+        errors = InvalidDataException({
+            'foo': [
+                ValidationException("foo error 1", 'foo_1'),
+                InvalidDataException({
+                    1: [ValidationException("foo 1 error", 'foo_1')],
+                }),
+                ValidationException("foo error 2", 'foo_2'),
+            ],
+            'bar': [ValidationException("bar error", 'bar')],
+        })
+
+        self.assertEqual(list(errors.flatten()), [
+            (('foo',), 'foo error 1'),
+            (('foo', 1), 'foo 1 error'),
+            (('foo',), 'foo error 2'),
+            (('bar',), 'bar error')])
+
+    def test_deeply_nested_errors(self):
+        depth = 5000
+        errors = InvalidDataException({0: [ValidationException("error", 'error')]})
+        for i in range(depth):
+            errors = InvalidDataException({0: [errors]})
+
+        self.assertEqual(list(errors.flatten()), [
+            ((0,) * (depth + 1), 'error')])
+
+
+class TestEquality(ValidatorTestCase):
+    def test_equal(self):
+        def make_errors():
+            return InvalidDataException({
+                'foo': [ValidationException("foo error", 'foo')],
+                'bar': [InvalidDataException({
+                    1: [ValidationException("bar 1 error", 'bar_1')],
+                })],
+            })
+
+        self.assertTrue(make_errors() == make_errors())
+        self.assertFalse(make_errors() != make_errors())
+
+    def test_not_equal(self):
+        errors = InvalidDataException({
+            'foo': [InvalidDataException({
+                1: [ValidationException("foo 1 error", 'foo_1')],
+            })],
+        })
+
+        self.assertNotEqual(errors, InvalidDataException({
+            'foo': [InvalidDataException({
+                1: [ValidationException("foo 1 error", 'nope')],
+            })],
+        }))
+        self.assertNotEqual(errors, InvalidDataException({
+            'foo': [InvalidDataException({
+                2: [ValidationException("foo 1 error", 'foo_1')],
+            })],
+        }))
+        self.assertNotEqual(errors, InvalidDataException({
+            'foo': [ValidationException("foo 1 error", 'foo_1')],
+        }))
+        self.assertNotEqual(errors, InvalidDataException({
+            'foo': [],
+        }))
+
+    def test_deeply_nested_errors(self):
+        def make_errors(code):
+            errors = InvalidDataException({0: [ValidationException("error", code)]})
+            for i in range(5000):
+                errors = InvalidDataException({0: [errors]})
+            return errors
+
+        self.assertTrue(make_errors('foo') == make_errors('foo'))
+        self.assertFalse(make_errors('foo') == make_errors('bar'))
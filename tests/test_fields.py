@@ -3,6 +3,8 @@ import datetime
 import math
 import sys
 
+import aniso8601
+
 from valedictory import Validator
 from valedictory.exceptions import (
     InvalidDataException, NoData, ValidationException)
@@ -46,6 +48,27 @@ class TestField(ValidatorTestCase):
         original.error_messages['required'] = 'bar'
         self.assertEqual(copied.error_messages['required'], 'foo')
 
+    def test_error_messages(self):
+        class ParentField(StringField):
+            default_error_messages = {'required': 'parent'}
+
+        class ChildField(ParentField):
+            default_error_messages = {'non_empty': 'child'}
+
+        parent = ParentField(error_messages={'max_length': 'instance'})
+        child = ChildField()
+
+        self.assertEqual(parent.error_messages['required'], 'parent')
+        self.assertEqual(parent.error_messages['non_empty'], "This field can not be empty")
+        self.assertEqual(parent.error_messages['max_length'], 'instance')
+
+        self.assertEqual(child.error_messages['required'], 'parent')
+        self.assertEqual(child.error_messages['non_empty'], 'child')
+        self.assertEqual(child.error_messages['max_length'], "Maximum length {max}")
+
+        # Instance error messages should not leak in to other instances
+        self.assertEqual(ParentField().error_messages['max_length'], "Maximum length {max}")
+
     def test_default(self):
         field = Field(default="foo", required=False)
         self.assertEqual("foo", field.clean(NoData))
@@ -55,6 +78,41 @@ class TestField(ValidatorTestCase):
             Field(default="foo", required=True)
 
 
+class TestTypedField(ValidatorTestCase):
+
+    def test_excluded_types(self):
+        field = TypedField(required_types=int, excluded_types=bool, type_name='int')
+        self.assertEqual(1, field.clean(1))
+        with self.assertRaises(ValidationException):
+            field.clean(True)
+        with self.assertRaises(InvalidDataException):
+            ListField(field).clean([1, True])
+
+    def test_clean_value(self):
+        class EvenField(TypedField):
+            required_types = int
+
+            def clean_value(self, value):
+                if value % 2:
+                    raise self.error('invalid_type', {'type': 'even'})
+                return value // 2
+
+        field = EvenField()
+        self.assertEqual(2, field.clean(4))
+        with self.assertRaises(ValidationException):
+            field.clean(3)
+        with self.assertRaises(ValidationException):
+            field.clean('4')
+
+        self.assertEqual([1, 2], ListField(field).clean([2, 4]))
+        with self.assertRaises(InvalidDataException) as cm:
+            ListField(field).clean([2, 3, '4'])
+        self.assertEqual(cm.exception, InvalidDataException({
+            1: [ValidationException("Expected a value of type 'even'", 'invalid_type')],
+            2: [ValidationException("Expected a value of type ''", 'invalid_type')],
+        }))
+
+
 class TestStringField(ValidatorTestCase):
 
     def test_simple(self):
@@ -77,6 +135,11 @@ class TestStringField(ValidatorTestCase):
         with self.assertRaises(ValidationException):
             field.clean("hello")
 
+    def test_no_max_length(self):
+        field = StringField()
+        self.assertEqual(field.max_length, float('inf'))
+        self.assertEqual("a" * 10000, field.clean("a" * 10000))
+
     def test_not_required(self):
         field = StringField(required=False)
         self.assertEqual("", field.clean(""))
@@ -234,6 +297,22 @@ class TestDateTimeField(ValidatorTestCase):
             datetime.datetime(1989, 10, 16, 8, 23, 45, tzinfo=datetime.timezone.utc),
             field.clean("19891016T082345+0000"))
 
+    def test_common_formats(self):
+        field = DateTimeField()
+        # Common formats are parsed without aniso8601,
+        # but should give exactly the same results
+        for value in [
+            "1989-10-16T08:23:45Z",
+            "1989-10-16T08:23:45.5Z",
+            "1989-10-16T08:23:45.123456+10:00",
+            "1989-10-16T08:23:45-05:30",
+        ]:
+            expected = aniso8601.parse_datetime(value)
+            actual = field.clean(value)
+            self.assertEqual(expected, actual)
+            self.assertIs(type(expected.tzinfo), type(actual.tzinfo))
+            self.assertEqual(expected.tzname(), actual.tzname())
+
     def test_timezone_required(self):
         field = DateTimeField()
         # Timezones are required by default
@@ -253,6 +332,10 @@ class TestDateTimeField(ValidatorTestCase):
         with self.assertRaises(ValidationException):
             field.clean("2015-02-29T10:11:12Z")
 
+        # Negative zero offsets are not allowed
+        with self.assertRaises(ValidationException):
+            field.clean("2015-02-20T10:11:12-00:00")
+
         # wat r u doin?
         with self.assertRaises(ValidationException):
             field.clean("Not even a date")
@@ -286,6 +369,12 @@ class TestDateField(ValidatorTestCase):
         # No leap year this year
         with self.assertRaises(ValidationException):
             field.clean("2015-2-29")
+        with self.assertRaises(ValidationException):
+            field.clean("2015-02-29")
+        with self.assertRaises(ValidationException):
+            field.clean("2015-13-01")
+        with self.assertRaises(ValidationException):
+            field.clean("0000-01-01")
 
         # Too many numbers in the year.
         # Sorry, Long Now Foundation!
@@ -312,6 +401,14 @@ class TestYearMonthField(ValidatorTestCase):
         self.assertEqual(
             (2345, 6),
             field.clean("2345-06"))
+        self.assertEqual(
+            (2345, 6),
+            field.clean("2345-6"))
+
+        with self.assertRaises(ValidationException):
+            field.clean("2345-13")
+        with self.assertRaises(ValidationException):
+            field.clean("0000-01")
 
     def test_invalid_dates(self):
         field = EmailField(max_length=10)
@@ -348,6 +445,13 @@ class TestChoiceField(ValidatorTestCase):
             with self.assertRaises(ValidationException):
                 field.clean(choice)
 
+    def test_deepcopy(self):
+        choice = object()
+        field = ChoiceField([choice])
+        copied = copy.deepcopy(field)
+        self.assertIsNot(field.choices, copied.choices)
+        self.assertIs(choice, copied.clean(choice))
+
 
 class TestChoiceMapField(ValidatorTestCase):
 
@@ -391,6 +495,24 @@ class TestDigitField(ValidatorTestCase):
         with self.assertRaises(ValidationException):
             field.clean("abc123")
 
+        # Only ASCII digits are allowed
+        with self.assertRaises(ValidationException):
+            field.clean("123\u0663")
+        with self.assertRaises(ValidationException):
+            field.clean("12\u00b2")
+
+    def test_alphabet(self):
+        field = DigitField(alphabet='01')
+        self.assertEqual("0110", field.clean("0110"))
+        with self.assertRaises(ValidationException):
+            field.clean("012")
+
+        # Characters that are special in regular expressions are not special here
+        field = DigitField(alphabet='^]-\\')
+        self.assertEqual("^]-\\", field.clean("^]-\\"))
+        with self.assertRaises(ValidationException):
+            field.clean("0")
+
 
 class TestCreditCardField(ValidatorTestCase):
 
@@ -446,6 +568,57 @@ class TestListField(ValidatorTestCase):
         else:
             self.fail("Expecting to catch ValidationException")
 
+    def assertCleanListMatchesClean(self, field, data):
+        """
+        Check that cleaning a list gives the same result as cleaning each item
+        """
+        expected_errors = InvalidDataException()
+        for i, datum in enumerate(data):
+            try:
+                field.clean(datum)
+            except ValidationException as err:
+                expected_errors.invalid_fields[i].append(err)
+        self.assertTrue(expected_errors)
+
+        with self.assertRaises(InvalidDataException) as cm:
+            ListField(field).clean(data)
+        self.assertEqual(expected_errors, cm.exception)
+        self.assertEqual(
+            [(path, error.msg) for path, errors in expected_errors.invalid_fields.items()
+             for error in errors],
+            [(path, error.msg) for path, errors in cm.exception.invalid_fields.items()
+             for error in errors])
+
+    def test_typed_errors(self):
+        self.assertCleanListMatchesClean(
+            BooleanField(), [True, 1, None, False, 'nope'])
+
+    def test_number_errors(self):
+        self.assertCleanListMatchesClean(
+            IntegerField(min=1, max=10), [0, 1, True, 10, 11, 1.5, '5'])
+
+    def test_string_errors(self):
+        self.assertCleanListMatchesClean(
+            StringField(max_length=3), ['', 'foo', 'quux', 1, None])
+        self.assertCleanListMatchesClean(
+            StringField(min_length=1, required=False), ['', 'foo'])
+        self.assertCleanListMatchesClean(
+            StringField(min_length=2, required=False), ['', 'f', 'foo'])
+
+    def test_subclass(self):
+        class EvenField(IntegerField):
+            def clean(self, data):
+                value = super().clean(data)
+                if value % 2:
+                    raise self.error('invalid_type', {'type': 'even integer'})
+                return value
+
+        field = ListField(EvenField())
+        self.assertEqual([2, 4], field.clean([2, 4]))
+        with self.assertRaises(InvalidDataException) as cm:
+            field.clean([2, 3, 4])
+        self.assertEqual([1], list(cm.exception.invalid_fields.keys()))
+
     def test_copy(self):
         original = ListField(TypedField(
             required_types=(bool, str),
@@ -492,3 +665,16 @@ class TestNestedLists(ValidatorTestCase):
         self.assertEqual(
             data,
             field.clean(data))
+
+    def test_nested_list_subclass(self):
+        class UpperNestedValidator(NestedValidator):
+            def clean(self, data):
+                value = super().clean(data)
+                return {k: v.upper() for k, v in value.items()}
+
+        field = ListField(UpperNestedValidator(Validator(fields={
+            'string': StringField()})))
+
+        self.assertEqual(
+            [{'string': 'FOO'}, {'string': 'BAR'}],
+            field.clean([{'string': 'foo'}, {'string': 'bar'}]))
@@ -1,10 +1,22 @@
+from unittest import mock
+
 from valedictory import InvalidDataException, Validator, fields
-from valedictory.exceptions import ValidationException
+from valedictory.exceptions import NoData, ValidationException
 from valedictory.validator import partition_dict
 
 from .utils import ValidatorTestCase
 
 
+class ComputedField(fields.Field):
+    """
+    A field that makes up a value when no data is supplied.
+    """
+    def clean(self, data):
+        if data is NoData:
+            return 'computed'
+        return super().clean(data)
+
+
 class TestValidators(ValidatorTestCase):
 
     def test_cleaning_fields(self):
@@ -45,6 +57,46 @@ class TestValidators(ValidatorTestCase):
 
         self.assertEqual({'int': 10, 'string': 'foo'}, cleaned_data)
 
+    def test_required_fields(self):
+        """
+        Every missing required field should be reported
+        """
+        validator = Validator(fields={
+            'int': fields.IntegerField(),
+            'string': fields.StringField(error_messages={'required': 'Need a string'})})
+
+        with self.assertRaises(InvalidDataException) as cm:
+            validator.clean({})
+        errors = cm.exception
+        self.assertEqual(errors, InvalidDataException({
+            'int': [ValidationException('This field is required', 'required')],
+            'string': [ValidationException('Need a string', 'required')]}))
+        self.assertEqual(errors.invalid_fields['string'][0].msg, 'Need a string')
+
+    def test_required_field_handles_missing_data(self):
+        """
+        Fields that handle missing data in ``clean`` should be passed ``NoData``
+        """
+        validator = Validator(fields={'x': ComputedField()})
+        self.assertEqual({'x': 'computed'}, validator.clean({}))
+
+    def test_missing_required_fields_not_cleaned(self):
+        """
+        Missing required fields that use the standard missing data handling
+        are reported without calling ``clean``
+        """
+        validator = Validator(fields={
+            'int': fields.IntegerField(),
+            'field': fields.Field()})
+        for field in validator.fields.values():
+            field.clean = mock.Mock(side_effect=AssertionError)
+
+        with self.assertRaises(InvalidDataException) as cm:
+            validator.clean({})
+        self.assertEqual(cm.exception, InvalidDataException({
+            'int': [ValidationException('This field is required', 'required')],
+            'field': [ValidationException('This field is required', 'required')]}))
+
     def test_not_required_fields(self):
         """
         Optional fields should be optional
@@ -59,6 +111,38 @@ class TestValidators(ValidatorTestCase):
         self.assertEqual({'int': 10, 'string': 'foo'},
                          validator.clean({'int': 10, 'string': 'foo'}))
 
+    def test_missing_optional_fields_not_cleaned(self):
+        """
+        Missing optional fields that use the standard missing data handling
+        are skipped without calling ``clean``
+        """
+        validator = Validator(fields={
+            'int': fields.IntegerField(required=False),
+            'string': fields.StringField(required=False),
+            'field': fields.Field(required=False)})
+        for field in validator.fields.values():
+            field.clean = mock.Mock(side_effect=AssertionError)
+
+        self.assertEqual({}, validator.clean({}))
+
+    def test_not_required_field_handles_missing_data(self):
+        """
+        Optional fields that handle missing data in ``clean`` should be passed ``NoData``
+        """
+        validator = Validator(fields={'x': ComputedField(required=False)})
+        self.assertEqual({'x': 'computed'}, validator.clean({}))
+
+    def test_default_fields(self):
+        """
+        Missing fields with a default should use the default
+        """
+        validator = Validator(fields={
+            'int': fields.IntegerField(required=False, default=0),
+            'string': fields.StringField(required=False, default='foo')})
+
+        self.assertEqual({'int': 0, 'string': 'foo'}, validator.clean({}))
+        self.assertEqual({'int': 10, 'string': 'foo'}, validator.clean({'int': 10}))
+
 
 class TestDeclarativeValidators(ValidatorTestCase):
 
@@ -86,6 +170,18 @@ class TestDeclarativeValidators(ValidatorTestCase):
             sorted(ChildValidator.fields.keys()),
             ['int', 'string'])
 
+    def test_inherited_fields_copied(self):
+        class ParentValidator(Validator):
+            int = fields.IntegerField()
+
+        class ChildValidator(ParentValidator):
+            string = fields.StringField()
+
+        # Each class should have its own copy of inherited fields
+        self.assertIsNot(ParentValidator.fields['int'], ChildValidator.fields['int'])
+        ChildValidator.fields['int'].required = False
+        self.assertTrue(ParentValidator.fields['int'].required)
+
     def test_multiple_inheritance(self):
         class P1Validator(Validator):
             int = fields.IntegerField()
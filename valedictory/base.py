@@ -1,11 +1,14 @@
-import copy
-
 from .exceptions import ValidationException
 
 
 class DeepCopyable:
     def __deepcopy__(self, memo):
-        obj = copy.copy(self)
+        # Copying the instance attributes directly is much cheaper than
+        # ``copy.copy``, which goes through the ``__reduce_ex__`` protocol.
+        # Subclasses deep copy any attributes that need it.
+        cls = type(self)
+        obj = cls.__new__(cls)
+        obj.__dict__.update(self.__dict__)
         memo[id(self)] = obj
         return obj
 
@@ -16,12 +19,32 @@ class ErrorMessageMixin(DeepCopyable):
     def __init__(self, error_messages=None, **kwargs):
         super().__init__(**kwargs)
 
-        messages = {}
-        for c in reversed(self.__class__.__mro__):
-            messages.update(getattr(c, 'default_error_messages', {}))
+        messages = dict(self.get_default_error_messages())
         messages.update(error_messages or {})
         self.error_messages = messages
 
+    @classmethod
+    def get_default_error_messages(cls):
+        """
+        Get the :attr:`default_error_messages` of this class merged with
+        those of all its parent classes.
+        This is computed once per class and cached,
+        rather than walking the MRO every time an instance is constructed.
+        The returned dict is shared, and must not be modified.
+        """
+        # Look in the class __dict__ directly,
+        # so subclasses do not pick up the cache from their parent class.
+        try:
+            return cls.__dict__['_merged_error_messages']
+        except KeyError:
+            pass
+
+        messages = {}
+        for c in reversed(cls.__mro__):
+            messages.update(getattr(c, 'default_error_messages', {}))
+        cls._merged_error_messages = messages
+        return messages
+
     def error(self, code, params=None, cls=ValidationException, **kwargs):
         """
         Construct a validation exception.
@@ -34,7 +57,11 @@ class ErrorMessageMixin(DeepCopyable):
         if params:
             message = message.format(**params)
 
-        return cls(message, code=code, **kwargs)
+        # Messages may be lazily translated strings, such as those from
+        # Django's ``ugettext_lazy``. These are resolved once here so the
+        # exception holds a plain string, instead of being re-rendered every
+        # time the message is used.
+        return cls(str(message), code=code, **kwargs)
 
     def __deepcopy__(self, memo):
         obj = super().__deepcopy__(memo)
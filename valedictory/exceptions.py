@@ -30,10 +30,12 @@ class InvalidDataException(BaseValidationException):
     #: may also be :exc:`InvalidDataException` instances.
     invalid_fields = None
 
-    def __init__(self, errors={}):
+    def __init__(self, errors=None):
         super(BaseValidationException, self).__init__()
         self.invalid_fields = defaultdict(list)
-        self.invalid_fields.update(errors)
+        # Most instances start out empty, and only collect errors later
+        if errors:
+            self.invalid_fields.update(errors)
 
     def __str__(self):
         inner = ', '.join('{0}: {1}'.format(k, v)
@@ -49,7 +51,30 @@ class InvalidDataException(BaseValidationException):
     def __eq__(self, other):
         if not isinstance(other, InvalidDataException):
             return NotImplemented
-        return self.invalid_fields == other.invalid_fields
+
+        # Nested exceptions are compared using a worklist rather than
+        # recursively, so that deeply nested errors do not hit the recursion
+        # limit, and the comparison stops at the first difference found.
+        stack = [(self, other)]
+        while stack:
+            left, right = stack.pop()
+            left_fields = left.invalid_fields
+            right_fields = right.invalid_fields
+            if left_fields.keys() != right_fields.keys():
+                return False
+
+            for name, left_errors in left_fields.items():
+                right_errors = right_fields[name]
+                if len(left_errors) != len(right_errors):
+                    return False
+                for left_error, right_error in zip(left_errors, right_errors):
+                    if (isinstance(left_error, InvalidDataException)
+                            and isinstance(right_error, InvalidDataException)):
+                        stack.append((left_error, right_error))
+                    elif left_error != right_error:
+                        return False
+
+        return True
 
     def __hash__(self):
         return id(self)
@@ -81,13 +106,30 @@ class InvalidDataException(BaseValidationException):
             (['items', 2, 'quantity'], ['This must be equal to or greater than the minimum of 1']),
         ]
         """
+        # Nested errors are walked using an explicit stack of iterators,
+        # rather than by recursively calling ``flatten``. Each error is then
+        # yielded directly, instead of being passed up through a generator
+        # for every level of nesting.
+        stack = [self._iter_errors(())]
+        while stack:
+            for path, error in stack[-1]:
+                if isinstance(error, InvalidDataException):
+                    stack.append(error._iter_errors(path))
+                    break
+                yield path, error.msg
+            else:
+                stack.pop()
+
+    def _iter_errors(self, path):
+        """
+        Yield a pair of ``(path, error)`` for each error directly in this
+        exception, where ``path`` is the given path extended with the field
+        name.
+        """
         for name, error_list in self.invalid_fields.items():
+            name_path = path + (name,)
             for error in error_list:
-                if isinstance(error, InvalidDataException):
-                    for nested_name, nested_error in error.flatten():
-                        yield (name,) + nested_name, nested_error
-                else:
-                    yield (name,), error.msg
+                yield name_path, error
 
 
 class ValidationException(BaseValidationException):
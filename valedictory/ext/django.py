@@ -2,15 +2,20 @@
 Fields that integrate with Django.
 """
 
-import copy
+from collections import defaultdict
 
-from django.core.exceptions import ValidationError
+from django.core.exceptions import FieldDoesNotExist, ValidationError
 from django.core.files.uploadedfile import UploadedFile
 from django.core.validators import URLValidator
+from django.db import connections
 from django.db.models import Model
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.query import ModelIterable
 from django.utils.translation import ugettext_lazy as _
 
 from valedictory import fields
+from valedictory.exceptions import (
+    BaseValidationException, InvalidDataException)
 
 
 class UploadedFileField(fields.TypedField):
@@ -68,9 +73,100 @@ class ForeignKeyField(fields.TypedField):
         except model.MultipleObjectsReturned:
             raise self.error('multiple')
 
+    def clean_list(self, data):
+        """
+        Clean a list of keys using as few queries as possible,
+        instead of one query per key.
+        """
+        # ``queryset`` may be a Manager, which lacks the QuerySet internals
+        queryset = self.queryset.all()
+        model_field = self._get_model_field()
+        if (model_field is None
+                or type(self).clean is not ForeignKeyField.clean
+                or queryset._iterable_class is not ModelIterable):
+            # Complex lookups, querysets that do not return model instances,
+            # and subclasses with their own clean logic
+            # fall back to cleaning each key individually
+            return super().clean_list(data)
+
+        # Normalise the keys in the same way the database lookup would, so
+        # they can be matched against the attributes of the fetched objects.
+        # Anything that can not be matched up is checked again with
+        # ``clean``, so the results are always the same as for ``clean``.
+        keys = {}
+        recheck = []
+        errors = {}
+        for i, datum in enumerate(data):
+            try:
+                keys[i] = model_field.to_python(super().clean(datum))
+            except ValidationError:
+                recheck.append((i, datum))
+            except BaseValidationException as err:
+                errors[i] = [err]
+
+        # Fetch the objects in batches small enough for the database backend
+        lookup_keys = list(dict.fromkeys(keys.values()))
+        lookup_set = set(lookup_keys)
+        batch_size = connections[queryset.db].features.max_query_params or max(len(lookup_keys), 1)
+        objects = defaultdict(list)
+        unmatched = False
+        for start in range(0, len(lookup_keys), batch_size):
+            batch = lookup_keys[start:start + batch_size]
+            for obj in queryset.filter(**{self.field + '__in': batch}):
+                key = getattr(obj, model_field.attname)
+                if key in lookup_set:
+                    objects[key].append(obj)
+                else:
+                    # The database matched this object to a key that is not
+                    # equal in Python, for example with a case insensitive
+                    # collation, so objects can not be matched up reliably.
+                    unmatched = True
+
+        cleaned = {}
+        for i, key in keys.items():
+            found = objects.get(key, [])
+            if len(found) > 1:
+                errors[i] = [self.error('multiple')]
+            elif len(found) == 1 and not unmatched:
+                cleaned[i] = found[0]
+            else:
+                recheck.append((i, data[i]))
+
+        for i, datum in recheck:
+            try:
+                cleaned[i] = self.clean(datum)
+            except BaseValidationException as err:
+                errors[i] = [err]
+
+        if errors:
+            raise InvalidDataException(errors)
+        return [cleaned[i] for i in range(len(cleaned))]
+
+    def _get_model_field(self):
+        """
+        Get the model field that :attr:`field` refers to,
+        or ``None`` if the field can not be fetched in bulk.
+        """
+        if LOOKUP_SEP in self.field:
+            return None
+
+        opts = self.queryset.model._meta
+        if self.field == 'pk':
+            return opts.pk
+
+        try:
+            model_field = opts.get_field(self.field)
+        except FieldDoesNotExist:
+            return None
+        if not model_field.concrete or model_field.many_to_many:
+            return None
+        return model_field
+
     def __deepcopy__(self, memo):
         obj = super(ForeignKeyField, self).__deepcopy__(memo)
-        obj.queryset = copy.deepcopy(obj.queryset, memo)
+        # ``all()`` makes an independent copy of the queryset, without deep
+        # copying every part of the underlying query
+        obj.queryset = obj.queryset.all()
         return obj
 
 
@@ -1,14 +1,96 @@
 import copy
 import datetime
+import functools
 import re
 from decimal import Decimal
 from gettext import gettext as _
 
 import aniso8601
+from aniso8601.timezone import parse_timezone
 
 from .base import ErrorMessageMixin
 from .exceptions import BaseValidationException, InvalidDataException, NoData
 
+# Complete dates and date times are by far the most common formats,
+# and are parsed directly instead of going through aniso8601.
+# Anything else, including values that are out of range,
+# is left to aniso8601 so that the results and errors are unchanged.
+# ``YYYY-MM-DD`` or ``YYYYMMDD``
+_date_re = re.compile(r"([0-9]{4})(-?)([0-9]{2})\2([0-9]{2})")
+# ``YYYY-MM-DDTHH:MM:SS[.ffffff][Z|+HH:MM|-HH:MM]``
+_datetime_re = re.compile(
+    r"([0-9]{4})-([0-9]{2})-([0-9]{2})T([0-9]{2}):([0-9]{2}):([0-9]{2})"
+    r"(?:\.([0-9]{1,6}))?(Z|[+-][0-9]{2}:[0-9]{2})?")
+# ``YYYY-MM``, matching the ``%Y-%m`` format of ``strptime``
+_year_month_re = re.compile(r"([0-9]{4})-(1[0-2]|0[1-9]|[1-9])")
+
+
+@functools.lru_cache(maxsize=128)
+def _deletion_table(characters):
+    """
+    Make a ``str.translate`` table that deletes all the given characters.
+    Fields only use a handful of different alphabets,
+    so the tables are cached rather than being rebuilt on every call.
+    """
+    return dict.fromkeys(map(ord, characters))
+
+
+@functools.lru_cache(maxsize=128)
+def _disallowed_characters_re(alphabet):
+    """
+    Make a regular expression that matches any character not in the alphabet.
+    Searching for a disallowed character is cheaper than deleting all the
+    allowed characters and checking if anything is left over.
+    """
+    if not alphabet:
+        return re.compile(r".", re.DOTALL)
+    return re.compile("[^" + re.escape(alphabet) + "]")
+
+
+# The value of each digit character, and the sum of the digits of each digit
+# when doubled, for the Luhn checksum used by credit card numbers.
+# Looking characters up directly is much cheaper than parsing them with ``int``.
+_luhn_digits = {str(d): d for d in range(10)}
+_luhn_doubled = {str(d): sum(divmod(d * 2, 10)) for d in range(10)}
+
+# The default ``max_length`` of fields with no maximum length.
+# Comparing an int against a float is relatively slow, so fields check for
+# this exact object first and skip the comparison entirely.
+_no_max_length = float('inf')
+
+
+# Parsed dates are cached, as the same values often appear many times
+# when validating a large batch of data. Input strings are bounded by the
+# ``max_length`` of the fields, so the caches stay small. Dates are
+# immutable, so the cached values can be shared safely.
+@functools.lru_cache(maxsize=1024)
+def _parse_date(date_string):
+    match = _date_re.fullmatch(date_string)
+    if match is not None:
+        year, _sep, month, day = match.groups()
+        try:
+            return datetime.date(int(year), int(month), int(day))
+        except ValueError:
+            pass
+    return aniso8601.parse_date(date_string)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_datetime(datetime_string):
+    match = _datetime_re.fullmatch(datetime_string)
+    if match is not None:
+        year, month, day, hour, minute, second, fraction, timezone = match.groups()
+        try:
+            return datetime.datetime(
+                int(year), int(month), int(day),
+                int(hour), int(minute), int(second),
+                int(fraction.ljust(6, '0')) if fraction else 0,
+                # Use the same tzinfo class as aniso8601
+                tzinfo=timezone and parse_timezone(timezone))
+        except ValueError:
+            pass
+    return aniso8601.parse_datetime(datetime_string)
+
 
 class Field(ErrorMessageMixin):
     """
@@ -28,6 +110,7 @@ class Field(ErrorMessageMixin):
     **Methods**
 
     .. automethod:: clean
+    .. automethod:: clean_list
     .. automethod:: error
     """
 
@@ -90,6 +173,35 @@ class Field(ErrorMessageMixin):
                 raise NoData
         return data
 
+    def clean_list(self, data):
+        """
+        Clean and validate every item in a list of data,
+        returning a list of the cleaned items.
+        This is used by :class:`ListField` to clean its items.
+
+        If any of the items fail validation, an
+        :exc:`~valedictory.exceptions.InvalidDataException` will be raised
+        with the errors for each invalid item, keyed by the item index.
+
+        By default each item is cleaned individually using :meth:`clean`.
+        Subclasses can override this to clean all the items at once,
+        for example to fetch them all in one database query.
+        """
+        # Errors are collected in a plain dict, and an exception is only
+        # made if any items are invalid.
+        errors = {}
+        cleaned_list = []
+        clean = self.clean
+        for i, datum in enumerate(data):
+            try:
+                cleaned_list.append(clean(datum))
+            except BaseValidationException as err:
+                errors[i] = [err]
+
+        if errors:
+            raise InvalidDataException(errors)
+        return cleaned_list
+
 
 class TypedField(Field):
     """
@@ -107,6 +219,8 @@ class TypedField(Field):
 
     .. autoattribute:: default_error_messages
         :annotation:
+
+    .. automethod:: clean_value
     """
 
     #: A tuple of acceptable classes for the data.
@@ -135,20 +249,65 @@ class TypedField(Field):
 
         if required_types is not None:
             self.required_types = required_types
-        if required_types is not None:
-            self.required_types = required_types
+        if excluded_types is not None:
+            self.excluded_types = excluded_types
         if type_name is not None:
             self.type_name = type_name
 
     def clean(self, data):
         value = super(TypedField, self).clean(data)
+        self._check_type(value)
+        return self.clean_value(value)
+
+    def clean_list(self, data):
+        if type(self).clean is not TypedField.clean:
+            # Subclasses with their own clean logic take the slow path
+            return super().clean_list(data)
+
+        # List items are never missing, so each item is checked directly,
+        # skipping the missing data handling in ``clean``.
+        check_type = self._check_type
+        clean_value = self.clean_value
+        errors = {}
+        cleaned_list = []
+        for i, value in enumerate(data):
+            try:
+                check_type(value)
+                cleaned_list.append(clean_value(value))
+            except BaseValidationException as err:
+                errors[i] = [err]
 
-        if (not isinstance(value, self.required_types) or
-                isinstance(value, self.excluded_types)):
-            raise self.error('invalid_type', {'type': self.type_name})
+        if errors:
+            raise InvalidDataException(errors)
+        return cleaned_list
 
+    def clean_value(self, value):
+        """
+        Validate and clean a value that is present in the data,
+        and is an instance of :attr:`required_types`,
+        returning the cleaned value.
+        This is called by both :meth:`clean` and :meth:`clean_list`.
+
+        By default the value is returned unchanged.
+        Subclasses can override this to add their own validation,
+        which will then be used for single values and lists alike.
+        """
         return value
 
+    def _check_type(self, value):
+        """
+        Raise an ``invalid_type`` error if ``value`` is not of the right type.
+        """
+        # Checking for an exact type match first is much cheaper than
+        # ``isinstance`` for the common case where ``required_types`` is a
+        # single class. Subclasses still fall through to ``isinstance``.
+        # Most fields have no ``excluded_types``, so that check is skipped.
+        required_types = self.required_types
+        excluded_types = self.excluded_types
+        if ((type(value) is not required_types and not isinstance(value, required_types))
+                or (excluded_types and isinstance(value, excluded_types))):
+            raise self.error('invalid_type', {'type': self.type_name})
+
 
 class StringField(TypedField):
     """
@@ -161,7 +320,7 @@ class StringField(TypedField):
     .. autoattribute:: default_error_messages
         :annotation:
     """
-    required_types = (str,)
+    required_types = str
 
     type_name = u'string'
 
@@ -171,7 +330,7 @@ class StringField(TypedField):
 
     #: The maximum acceptable length of the string.
     #: Defaults to no maximum length.
-    max_length = float('inf')
+    max_length = _no_max_length
 
     #:
     #: non_empty
@@ -205,19 +364,20 @@ class StringField(TypedField):
         if max_length is not None:
             self.max_length = max_length
 
-    def clean(self, data):
-        value = super(StringField, self).clean(data)
+    def clean_value(self, value):
         if value == u'' and self.required:
             raise self.error('required')
 
-        if len(value) < self.min_length:
+        length = len(value)
+        if length < self.min_length:
             if self.min_length == 1:
                 raise self.error('non_empty')
             else:
                 raise self.error('min_length', {'min': self.min_length})
 
-        if len(value) > self.max_length:
-            raise self.error('max_length', {'max': self.max_length})
+        max_length = self.max_length
+        if max_length is not _no_max_length and length > max_length:
+            raise self.error('max_length', {'max': max_length})
 
         return value
 
@@ -279,14 +439,14 @@ class NumberField(TypedField):
         if max is not None:
             self.max = max
 
-    def clean(self, data):
-        value = super().clean(data)
-
-        if self.min is not None and value < self.min:
-            raise self.error('min_value', {'min': self.min})
+    def clean_value(self, value):
+        minimum = self.min
+        if minimum is not None and value < minimum:
+            raise self.error('min_value', {'min': minimum})
 
-        if self.max is not None and value > self.max:
-            raise self.error('max_value', {'max': self.max})
+        maximum = self.max
+        if maximum is not None and value > maximum:
+            raise self.error('max_value', {'max': maximum})
 
         return value
 
@@ -330,7 +490,9 @@ class EmailField(StringField):
 
     def clean(self, data):
         value = super(EmailField, self).clean(data)
-        if not self.email_re.match(value):
+        # Checking for an '@' is much cheaper than running the regular
+        # expression, and rejects most invalid input straight away
+        if '@' not in value or not self.email_re.match(value):
             raise self.error('invalid_email')
         return value
 
@@ -376,7 +538,7 @@ class DateTimeField(StringField):
         date_string = super(DateTimeField, self).clean(data)
 
         try:
-            value = aniso8601.parse_datetime(date_string)
+            value = _parse_datetime(date_string)
         except (ValueError, NotImplementedError):
             raise self.error('invalid_format')
 
@@ -409,7 +571,7 @@ class DateField(StringField):
     def clean(self, data):
         date_string = super(DateField, self).clean(data)
         try:
-            return aniso8601.parse_date(date_string)
+            return _parse_date(date_string)
         except ValueError:
             raise self.error('invalid_format')
 
@@ -488,6 +650,12 @@ class YearMonthField(StringField):
     def clean(self, data):
         date_string = super(YearMonthField, self).clean(data)
 
+        match = _year_month_re.fullmatch(date_string)
+        if match is not None:
+            year, month = map(int, match.groups())
+            if year >= datetime.MINYEAR:
+                return (year, month)
+
         try:
             date = datetime.datetime.strptime(date_string, "%Y-%m").date()
         except ValueError:
@@ -536,7 +704,10 @@ class ChoiceField(Field):
 
     def __deepcopy__(self, memo):
         obj = super().__deepcopy__(memo)
-        obj.choices = copy.deepcopy(obj.choices, memo)
+        # The choices themselves are shared rather than deep copied, so that
+        # choices which compare by identity are still accepted by the copy.
+        if obj.choices is not None:
+            obj.choices = set(obj.choices)
         return obj
 
 
@@ -635,7 +806,7 @@ class PunctuatedCharacterField(TypedField):
     #: The maximum length of the cleaned output data,
     #: not including punctuation characters.
     #: There is no maximum length by default.
-    max_length = float('inf')
+    max_length = _no_max_length
 
     #:
     #: allowed_characters
@@ -684,22 +855,22 @@ class PunctuatedCharacterField(TypedField):
         value = super(PunctuatedCharacterField, self).clean(data)
 
         # Strip out punctuation
-        alphabet_dict = dict((ord(c), None) for c in self.alphabet)
-        punctuation_dict = dict((ord(c), None) for c in self.punctuation)
+        punctuation = self.punctuation
+        if punctuation:
+            value = value.translate(_deletion_table(punctuation))
 
-        value = value.translate(punctuation_dict)
-        stripped_value = value.translate(alphabet_dict)
-
-        if len(stripped_value) != 0:
+        if _disallowed_characters_re(self.alphabet).search(value) is not None:
             raise self.error('allowed_characters', {
                 'alphabet': self.alphabet,
                 'punctuation': self.punctuation})
 
-        if len(value) < self.min_length:
+        length = len(value)
+        if length < self.min_length:
             raise self.error('min_length', {'min': self.min_length})
 
-        if len(value) > self.max_length:
-            raise self.error('max_length', {'max': self.max_length})
+        max_length = self.max_length
+        if max_length is not _no_max_length and length > max_length:
+            raise self.error('max_length', {'max': max_length})
 
         return value
 
@@ -762,9 +933,11 @@ class CreditCardField(PunctuatedCharacterField):
         return value
 
     def luhn_checksum(self, card_number):
-        digits = list(map(int, reversed(card_number)))
-        evens = sum(digits[0::2])
-        odds = sum(sum(divmod(digit * 2, 10)) for digit in digits[1::2])
+        # Every second digit, counting from the right, is doubled, and the
+        # digits of the result summed. This is looked up in a table, and the
+        # slicing, summing, and lookups all happen in C.
+        evens = sum(map(_luhn_digits.__getitem__, card_number[::-2]))
+        odds = sum(map(_luhn_doubled.__getitem__, card_number[-2::-2]))
         return (evens + odds) % 10 == 0
 
 
@@ -807,18 +980,7 @@ class ListField(TypedField):
 
     def clean(self, data):
         value = super(ListField, self).clean(data)
-
-        errors = InvalidDataException()
-        cleaned_list = []
-        for i, datum in enumerate(value):
-            try:
-                cleaned_list.append(self.field.clean(datum))
-            except BaseValidationException as err:
-                errors.invalid_fields[i].append(err)
-
-        if errors:
-            raise errors
-        return cleaned_list
+        return self.field.clean_list(value)
 
     def __deepcopy__(self, memo):
         obj = super().__deepcopy__(memo)
@@ -859,7 +1021,7 @@ class NestedValidator(TypedField):
             }
         }
     """
-    required_types = (dict, )
+    required_types = dict
     type_name = 'object'
 
     def __init__(self, validator=None, **kwargs):
@@ -877,8 +1039,7 @@ class NestedValidator(TypedField):
         if validator is not None:
             self.validator = validator
 
-    def clean(self, data):
-        value = super(NestedValidator, self).clean(data)
+    def clean_value(self, value):
         return self.validator.clean(value)
 
     def __deepcopy__(self, memo):
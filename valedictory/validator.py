@@ -1,10 +1,9 @@
 import copy
-import functools
 from gettext import gettext as _
 
 from .base import ErrorMessageMixin
 from .exceptions import BaseValidationException, InvalidDataException, NoData
-from .fields import Field
+from .fields import Field, TypedField
 
 
 def partition_dict(d, pred, dict_class=dict):
@@ -16,15 +15,13 @@ def partition_dict(d, pred, dict_class=dict):
     ``pred`` returned ``False``, and ``true`` is a dict with all pairs where
     ``pred`` returned ``True``.
     """
-    def iterator(acc, pair):
-        f, t = acc
-        key, val = pair
+    f, t = dict_class(), dict_class()
+    for key, val in d.items():
         if pred(key, val):
             t[key] = val
         else:
             f[key] = val
-        return f, t
-    return functools.reduce(iterator, d.items(), (dict_class(), dict_class()))
+    return f, t
 
 
 class DeclarativeFieldsMetaclass(type):
@@ -38,15 +35,17 @@ class DeclarativeFieldsMetaclass(type):
             mcs, name, bases, attrs)
 
         # Set the declared fields to the `fields` attribute, merging in any
-        # existing fields
+        # existing fields. The fields that win are found first, so that each
+        # field is only copied once, rather than once for every base class
+        # it appears in.
         fields = {}
         field_sets = [getattr(base, 'fields', {}) for base in reversed(cls.__mro__)]
         field_sets.append(new_fields)
         for field_set in field_sets:
             if field_set is None:
                 continue
-            for name, field in field_set.items():
-                fields[name] = copy.deepcopy(field)
+            fields.update(field_set)
+        fields = {name: copy.deepcopy(field) for name, field in fields.items()}
         setattr(cls, 'fields', fields)
 
         return cls
@@ -98,25 +97,44 @@ class BaseValidator(ErrorMessageMixin):
 
     def clean_fields(self, data):
         errors = InvalidDataException()
+        invalid_fields = errors.invalid_fields
         cleaned_data = {}
+        fields = self.fields
         # Check for unknown fields
         if not self.allow_unknown_fields:
-            unknown_fields = set(data.keys()) - set(self.fields.keys())
-            for name in unknown_fields:
-                errors.invalid_fields[name].append(self.error('unknown'))
+            # Checking each key is cheaper than building a set difference for
+            # typical payloads, and reports unknown fields in input order.
+            for name in data:
+                if name not in fields:
+                    invalid_fields[name].append(self.error('unknown'))
+
+        # Validate all incoming fields. The attribute lookups are hoisted out
+        # of the loop, but the fields are not cached between calls as
+        # ``self.fields`` can be modified after the validator is constructed.
+        get = data.get
+        for name, field in fields.items():
+            datum = get(name, NoData)
+            if datum is NoData and not field.has_default and (
+                    type(field).clean is Field.clean
+                    or type(field).clean is TypedField.clean):
+                # Missing fields are handled here with a sentinel check,
+                # rather than by raising and catching ``NoData`` or the
+                # required error through ``field.clean``. ``TypedField.clean``
+                # hands missing data straight to ``Field.clean``. Fields with
+                # any other clean logic may handle ``NoData`` themselves,
+                # so they are always passed the missing data.
+                if field.required:
+                    invalid_fields[name].append(field.error('required'))
+                continue
 
-        # Validate all incoming fields
-        for name, field in self.fields.items():
             try:
-                datum = data.get(name, NoData)
-                value = field.clean(datum)
-                cleaned_data[name] = value
+                cleaned_data[name] = field.clean(datum)
 
             except NoData:
                 pass
 
             except BaseValidationException as err:
-                errors.invalid_fields[name].append(err)
+                invalid_fields[name].append(err)
 
         return cleaned_data, errors
 